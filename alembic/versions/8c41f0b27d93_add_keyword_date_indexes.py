@@ -0,0 +1,67 @@
+"""add keyword/date indexes to snapshots and scores
+
+Revision ID: 8c41f0b27d93
+Revises: 2bf1de1c6f50
+Create Date: 2026-08-30 10:14:07.311842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41f0b27d93'
+down_revision: Union[str, Sequence[str], None] = '2bf1de1c6f50'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The old write path inserted blindly, so same-day re-runs left
+    # duplicate (keyword, date) rows behind. Keep only the newest row of
+    # each pair, or the unique indexes below fail to build.
+    op.execute("""
+        DELETE FROM daily_snapshots a
+        USING daily_snapshots b
+        WHERE a.keyword_id = b.keyword_id
+          AND a.snapshot_date = b.snapshot_date
+          AND a.id < b.id
+    """)
+    op.execute("""
+        DELETE FROM opportunity_scores a
+        USING opportunity_scores b
+        WHERE a.keyword_id = b.keyword_id
+          AND a.score_date = b.score_date
+          AND a.id < b.id
+    """)
+    op.create_index(
+        'ix_daily_snap_kw_date',
+        'daily_snapshots',
+        ['keyword_id', 'snapshot_date'],
+        unique=True,
+    )
+    op.create_index(
+        'ix_opp_score_kw_date',
+        'opportunity_scores',
+        ['keyword_id', 'score_date'],
+        unique=True,
+    )
+    op.alter_column(
+        'daily_snapshots', 'snapshot_date',
+        server_default=sa.text('CURRENT_DATE'),
+    )
+    op.alter_column(
+        'opportunity_scores', 'score_date',
+        server_default=sa.text('CURRENT_DATE'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('opportunity_scores', 'score_date', server_default=None)
+    op.alter_column('daily_snapshots', 'snapshot_date', server_default=None)
+    op.drop_index('ix_opp_score_kw_date', table_name='opportunity_scores')
+    op.drop_index('ix_daily_snap_kw_date', table_name='daily_snapshots')
@@ -0,0 +1,42 @@
+"""store trend_values as a native float array
+
+Revision ID: d57a91c4e2b8
+Revises: 8c41f0b27d93
+Create Date: 2026-08-30 10:52:33.604219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd57a91c4e2b8'
+down_revision: Union[str, Sequence[str], None] = '8c41f0b27d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # JSON text '[1, 2, 3]' becomes the array literal '{1, 2, 3}'; a JSON
+    # null (the backfill script stores one when trends are missing) must
+    # become SQL NULL, not the malformed literal 'null'
+    op.alter_column(
+        'daily_snapshots', 'trend_values',
+        type_=postgresql.ARRAY(sa.Float()),
+        postgresql_using=(
+            "translate(nullif(trend_values::text, 'null'), '[]', '{}')::float8[]"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'daily_snapshots', 'trend_values',
+        type_=sa.JSON(),
+        postgresql_using='to_json(trend_values)',
+    )
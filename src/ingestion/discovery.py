@@ -4,9 +4,18 @@ Discovery pipeline - finds trending products with low competition.
 Ties together eBay browsing, keyword extraction, and Google Trends.
 """
 
-from ingestion.ebay_scraper import browse_category, extract_keywords
+import concurrent.futures
+
+from ingestion.ebay_scraper import browse_category, extract_keywords, get_access_token
 from ingestion.google_trends import fetch_trends, filter_rising_keywords
 
+# Keep this low - Google Trends rate-limits aggressively
+TRENDS_MAX_WORKERS = 4
+
+# Google Trends hard-caps comparisons at 5 keywords per request, so this
+# is the largest batch we can coalesce into a single round-trip
+TRENDS_BATCH_SIZE = 5
+
 
 # eBay category IDs (for reference)
 CATEGORIES = {
@@ -90,26 +99,36 @@ def discover_opportunities(category, limit=100):
     3. Check Google Trends for rising interest
     4. Return keywords that are trending up
     """
+    # Authenticate once, then reuse the token for every eBay call below
+    token = get_access_token()
     # Get products from eBay
-    products = browse_category(category["id"], category["seed"], limit)
+    products = browse_category(category["id"], category["seed"], limit, token=token)
     # Get keywords from titles
     keyword_map = extract_keywords(
         products, category["stop_words"], category["anchors"], category.get("blacklist")
     )
     keywords = list(keyword_map.keys())
-    # Check trends in batches of 5
+    # Check trends in max-size batches (the Google Trends limit). The
+    # batches are independent HTTP calls, so they all go out through the
+    # pool at once, and each DataFrame is processed as its fetch lands -
+    # the pandas work overlaps the remaining network waits.
     all_rising_keywords = {}
-    for i in range(0, len(keywords), 5):
-        batch = keywords[i : i + 5]
-        trends = fetch_trends(batch)
-        if not trends.empty:
-            rising_data = filter_rising_keywords(trends)
-            all_rising_keywords.update(rising_data)
-    # Filter keyword_map to only rising keywords
+    with concurrent.futures.ThreadPoolExecutor(max_workers=TRENDS_MAX_WORKERS) as ex:
+        futures = [
+            ex.submit(fetch_trends, keywords[i : i + TRENDS_BATCH_SIZE])
+            for i in range(0, len(keywords), TRENDS_BATCH_SIZE)
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            trends = future.result()
+            if not trends.empty:
+                rising_data = filter_rising_keywords(trends)
+                all_rising_keywords.update(rising_data)
+    # Filter keyword_map to only rising keywords - dict keys() support
+    # C-level set intersection, so no per-key membership checks needed
+    common = keyword_map.keys() & all_rising_keywords.keys()
     rising_map = {
         kw: {"products": keyword_map[kw], "trends": all_rising_keywords[kw]}
-        for kw in all_rising_keywords.keys()
-        if kw in keyword_map
+        for kw in common
     }
     return rising_map
 
@@ -4,6 +4,7 @@ Google Trends scraper - fetches search interest data.
 Uses pytrends library (unofficial Google Trends API).
 """
 
+import random
 import time
 import pandas as pd
 from pytrends.request import TrendReq
@@ -12,6 +13,16 @@ from pytrends.request import TrendReq
 GEO = "AU"  # Country code (AU = Australia, US = United States, etc.)
 TIMEFRAME = "today 12-m"  # Last 12 months
 
+# Retry backoff - exponential with full jitter so parallel workers don't
+# all retry at the same instant (a fixed 30s/60s/90s schedule synchronizes
+# them into a thundering herd)
+RETRY_BASE_WAIT = 30  # seconds
+RETRY_MAX_WAIT = 120  # cap on any single wait
+
+# When Google rate-limits us it may say how long to back off; fetch_trends
+# stashes that hint here for fetch_trends_with_retry to use
+_last_retry_after = None
+
 
 def fetch_trends(keywords, geo=GEO, timeframe=TIMEFRAME):
     """
@@ -43,9 +54,18 @@ def fetch_trends(keywords, geo=GEO, timeframe=TIMEFRAME):
         return df
 
     except Exception as e:
+        global _last_retry_after
         # Check if rate limited
         if "429" in str(e):
             print("Rate limited by Google. Wait a minute and try again.")
+            # pytrends attaches the HTTP response to some errors - keep the
+            # Retry-After hint if Google sent one
+            response = getattr(e, "response", None)
+            header = response.headers.get("Retry-After") if response is not None else None
+            try:
+                _last_retry_after = float(header) if header else None
+            except ValueError:
+                _last_retry_after = None
         else:
             print(f"Error: {e}")
         return pd.DataFrame()
@@ -55,17 +75,27 @@ def fetch_trends_with_retry(keywords, max_retries=3):
     """
     Same as fetch_trends but retries on failure.
 
-    Useful because Google Trends sometimes rate-limits requests.
+    Useful because Google Trends sometimes rate-limits requests. Waits
+    grow exponentially with full jitter, and a Retry-After hint from a
+    429 response takes precedence over the computed wait.
     """
+    global _last_retry_after
+
     for attempt in range(max_retries):
+        _last_retry_after = None
         df = fetch_trends(keywords)
 
         if not df.empty:
             return df
 
         if attempt < max_retries - 1:
-            wait_time = 30 * (attempt + 1)  # 30s, 60s, 90s
-            print(f"Retrying in {wait_time} seconds...")
+            if _last_retry_after is not None:
+                wait_time = min(RETRY_MAX_WAIT, _last_retry_after)
+            else:
+                wait_time = random.uniform(
+                    0, min(RETRY_MAX_WAIT, RETRY_BASE_WAIT * 2**attempt)
+                )
+            print(f"Retrying in {wait_time:.0f} seconds...")
             time.sleep(wait_time)
 
     print("All retries failed")
@@ -78,20 +108,12 @@ def filter_rising_keywords(trends_df):
 
     Returns list of keyword names that are trending upward.
     """
-    rising_map = {}
-
-    for keyword in trends_df.columns:
-        # Skip the 'isPartial' column that pytrends adds
-        if keyword == "isPartial":
-            continue
-        # Get the data for this keyword
-        data = trends_df[keyword].dropna()
-        # Get last 4 weeks average
-        last_4_weeks = data.tail(4).mean()
-        # Get last 8 weeks average
-        previous_4_weeks = data.tail(8).head(4).mean()
-        # If last 4 weeks is greater than previous 4 weeks, add to rising list
-        if last_4_weeks > previous_4_weeks:
-            rising_map[keyword] = data.tail(12).tolist()
-
-    return rising_map
+    # Drop the 'isPartial' column that pytrends adds, then compare the
+    # whole frame at once - two column-wise reductions instead of a
+    # Python loop with per-keyword Series slicing (mean() skips NaN)
+    data = trends_df.drop(columns=["isPartial"], errors="ignore")
+    last_4_weeks = data.iloc[-4:].mean()
+    previous_4_weeks = data.iloc[-8:-4].mean()
+    rising = last_4_weeks.index[last_4_weeks > previous_4_weeks]
+
+    return {keyword: data[keyword].dropna().tail(12).tolist() for keyword in rising}
@@ -11,7 +11,7 @@ from storage.history import save_all
 from storage.crud import (
     save_category,
     save_keyword,
-    save_daily_snapshot,
+    save_daily_snapshots,
     save_opportunity_score,
 )
 
@@ -32,7 +32,7 @@ def get_or_create_category(category_name, category):
 def collect_and_save_category(category_name, category):
     """
     Collect data for a single category and save to database.
-    Returns opportunities, features, scores for CSV backup.
+    Returns opportunities, features, scores for the history backup.
     """
     print(f"\n{'=' * 50}")
     print(f"Processing: {category_name}")
@@ -61,28 +61,25 @@ def collect_and_save_category(category_name, category):
 
     # Step 4: Save daily snapshots
     today = date.today()
-    for keyword, feat in features.items():
-        keyword_id = keyword_ids[keyword]
-        products = opportunities[keyword]["products"]
-        trends = opportunities[keyword]["trends"]
-
-        unique_sellers = len(set(p["seller"] for p in products if p.get("seller")))
-
-        save_daily_snapshot(
-            keyword_id=keyword_id,
-            snapshot_date=today,
-            trend_momentum=feat["trend_momentum"],
-            trend_acceleration=feat["trend_acceleration"],
-            competition_density=feat["competition_density"],
-            avg_price=feat["price_stats"]["avg_price"],
-            min_price=feat["price_stats"]["min_price"],
-            max_price=feat["price_stats"]["max_price"],
-            price_spread=feat["price_stats"]["price_spread"],
-            listing_count=len(products),
-            unique_sellers=unique_sellers,
-            trend_values=trends,
-        )
-    print(f"Saved {len(features)} daily snapshots")
+    snapshot_rows = [
+        {
+            "keyword_id": keyword_ids[keyword],
+            "snapshot_date": today,
+            "trend_momentum": feat["trend_momentum"],
+            "trend_acceleration": feat["trend_acceleration"],
+            "competition_density": feat["competition_density"],
+            "avg_price": feat["price_stats"]["avg_price"],
+            "min_price": feat["price_stats"]["min_price"],
+            "max_price": feat["price_stats"]["max_price"],
+            "price_spread": feat["price_stats"]["price_spread"],
+            "listing_count": feat["listing_count"],
+            "unique_sellers": feat["unique_sellers"],
+            "trend_values": opportunities[keyword]["trends"],
+        }
+        for keyword, feat in features.items()
+    ]
+    save_daily_snapshots(snapshot_rows)
+    print(f"Saved {len(snapshot_rows)} daily snapshots")
 
     # Step 5: Calculate and save scores
     ranked = rank_opportunities(features)
@@ -129,9 +126,9 @@ def run_pipeline():
         print("\nNo data to save.")
         return all_opportunities, all_features, all_scores
 
-    # Save to CSV history (backup)
+    # Save to Parquet history (backup)
     print("\n" + "=" * 50)
-    print("SAVING CSV BACKUP")
+    print("SAVING HISTORY BACKUP")
     print("=" * 50)
     save_all(all_opportunities, all_features, all_scores)
 
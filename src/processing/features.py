@@ -4,57 +4,61 @@ Feature engineering for market opportunity detection.
 Calculates metrics from raw eBay and Google Trends data.
 """
 
+import numpy as np
+
 
 def calculate_trend_momentum(trends):
     """
     Calculate trend momentum as % change between last 4 weeks and previous 4 weeks.
 
+    Accepts a list or NumPy array of weekly values.
+
     Returns: float (e.g., 0.15 = 15% growth, -0.10 = 10% decline)
     """
-    if len(trends) < 8:
+    trends = np.asarray(trends, dtype=np.float64)
+    if trends.size < 8:
         return 0.0
 
-    last_4 = trends[-4:]
-    last_4_avg = sum(last_4) / len(last_4)
-
-    prev_4 = trends[-8:-4]
-    prev_4_avg = sum(prev_4) / len(prev_4)
+    last_4_avg = trends[-4:].mean()
+    prev_4_avg = trends[-8:-4].mean()
 
     if prev_4_avg == 0:
         return 0.0
 
     momentum = (last_4_avg - prev_4_avg) / prev_4_avg
-    return round(momentum, 4)
+    return round(float(momentum), 4)
 
 
 def calculate_trend_acceleration(trends):
     """
     Check if trend momentum is increasing (growth is speeding up).
 
+    Accepts a list or NumPy array of weekly values.
+
     Returns: bool
     """
-    if len(trends) < 12:
+    trends = np.asarray(trends, dtype=np.float64)
+    if trends.size < 12:
         return False
 
     # Older momentum: weeks 9-12 vs 5-8
-    older_prev = trends[-12:-8]
-    older_last = trends[-8:-4]
-    older_momentum = (
-        (sum(older_last) / 4 - sum(older_prev) / 4) / (sum(older_prev) / 4)
-        if sum(older_prev) > 0
-        else 0
-    )
+    older_prev = trends[-12:-8].mean()
+    older_last = trends[-8:-4].mean()
+    older_momentum = (older_last - older_prev) / older_prev if older_prev > 0 else 0
 
     # Recent momentum: weeks 5-8 vs 1-4
-    recent_prev = trends[-8:-4]
-    recent_last = trends[-4:]
-    recent_momentum = (
-        (sum(recent_last) / 4 - sum(recent_prev) / 4) / (sum(recent_prev) / 4)
-        if sum(recent_prev) > 0
-        else 0
-    )
+    recent_prev = trends[-8:-4].mean()
+    recent_last = trends[-4:].mean()
+    recent_momentum = (recent_last - recent_prev) / recent_prev if recent_prev > 0 else 0
 
-    return recent_momentum > older_momentum
+    return bool(recent_momentum > older_momentum)
+
+
+def prices_array(products):
+    """Collect the valid prices from a product list into a float64 array."""
+    return np.fromiter(
+        (float(p["price"]) for p in products if p.get("price")), dtype=np.float64
+    )
 
 
 def calculate_price_stats(products):
@@ -67,9 +71,12 @@ def calculate_price_stats(products):
     - max_price: maximum price
     - price_spread: price spread as % of average price
     """
-    prices = [float(p["price"]) for p in products if p.get("price")]
+    return price_stats_from_array(prices_array(products))
+
 
-    if not prices:
+def price_stats_from_array(prices):
+    """Price stats from an already-built prices array (see prices_array)."""
+    if prices.size == 0:
         return {
             "avg_price": 0,
             "min_price": 0,
@@ -77,27 +84,31 @@ def calculate_price_stats(products):
             "price_spread": 0,
         }
 
-    avg_price = sum(prices) / len(prices)
-    min_price = min(prices)
-    max_price = max(prices)
+    avg_price = prices.mean()
+    min_price = prices.min()
+    max_price = prices.max()
 
     price_spread = ((max_price - min_price) / avg_price) if avg_price > 0 else 0
 
     return {
-        "avg_price": round(avg_price, 2),
-        "min_price": round(min_price, 2),
-        "max_price": round(max_price, 2),
-        "price_spread": round(price_spread, 2),
+        "avg_price": round(float(avg_price), 2),
+        "min_price": round(float(min_price), 2),
+        "max_price": round(float(max_price), 2),
+        "price_spread": round(float(price_spread), 2),
     }
 
 
-def calculate_competition_density(products, trends):
+def calculate_competition_density(unique_sellers, trends):
     """
-    Calculate competition density as the number of unique sellers divided by the number of products.
+    Calculate competition density as the number of unique sellers relative
+    to the average trend interest.
+
+    Takes the seller count directly so callers that already counted
+    sellers (calculate_features, the scraper summaries) don't trigger
+    another scan of the product list.
 
     Returns: float (e.g., 0.5 = 50% competition density)
     """
-    unique_sellers = len(set([p["seller"] for p in products if p.get("seller")]))
     avg_trend = sum(trends) / len(trends)
     return (unique_sellers / avg_trend) if avg_trend > 0 else 0
 
@@ -112,19 +123,64 @@ def calculate_features(opportunities):
     - competition_density: competition density
     - trend_momentum: trend momentum
     - trend_acceleration: trend acceleration
+    - listing_count / unique_sellers: product summary, so downstream
+      consumers don't rescan the product list
+
+    The trend metrics for all keywords are computed from one stacked
+    (n_keywords, n_weeks) matrix, so momentum and acceleration are a
+    handful of NumPy reductions instead of per-keyword Python calls.
     """
+    if not opportunities:
+        return {}
+
+    keywords = list(opportunities.keys())
+    trend_arrays = [
+        np.asarray(data["trends"], dtype=np.float64) for data in opportunities.values()
+    ]
+    lengths = np.array([arr.size for arr in trend_arrays])
+
+    # Left-pad shorter series with NaN into one matrix (at least 12 wide
+    # so the slices below always exist); NaN slots fall out through the
+    # length masks
+    width = max(12, int(lengths.max()) if lengths.size else 12)
+    matrix = np.full((len(keywords), width), np.nan)
+    for i, arr in enumerate(trend_arrays):
+        if arr.size:
+            matrix[i, width - arr.size:] = arr
+
+    last_4 = matrix[:, -4:].mean(axis=1)
+    prev_4 = matrix[:, -8:-4].mean(axis=1)
+    older_prev_4 = matrix[:, -12:-8].mean(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        momentum = (last_4 - prev_4) / prev_4
+        recent_momentum = momentum
+        older_momentum = (prev_4 - older_prev_4) / older_prev_4
+        avg_trend = np.where(lengths > 0, np.nanmean(matrix, axis=1), 0.0)
+
+    # Same guards as the scalar functions: momentum needs 8 weeks and a
+    # non-zero baseline, acceleration needs 12
+    momentum = np.round(np.where((lengths >= 8) & (prev_4 > 0), momentum, 0.0), 4)
+    recent_momentum = np.where(prev_4 > 0, recent_momentum, 0.0)
+    older_momentum = np.where(older_prev_4 > 0, older_momentum, 0.0)
+    acceleration = (lengths >= 12) & (recent_momentum > older_momentum)
+
     feature_map = {}
-    for kw, data in opportunities.items():
-        products = data["products"]
-        trends = data["trends"]
-        price_stats = calculate_price_stats(products)
-        competition_density = calculate_competition_density(products, trends)
-        trend_momentum = calculate_trend_momentum(trends)
-        trend_acceleration = calculate_trend_acceleration(trends)
+    for i, kw in enumerate(keywords):
+        products = opportunities[kw]["products"]
+        # Scan the product list once for prices and sellers; everything
+        # below works off these cached summaries
+        prices = prices_array(products)
+        unique_sellers = len({p["seller"] for p in products if p.get("seller")})
+        competition_density = (
+            unique_sellers / avg_trend[i] if avg_trend[i] > 0 else 0
+        )
         feature_map[kw] = {
-            "price_stats": price_stats,
+            "price_stats": price_stats_from_array(prices),
             "competition_density": competition_density,
-            "trend_momentum": trend_momentum,
-            "trend_acceleration": trend_acceleration,
+            "trend_momentum": float(momentum[i]),
+            "trend_acceleration": bool(acceleration[i]),
+            "listing_count": len(products),
+            "unique_sellers": unique_sellers,
         }
     return feature_map
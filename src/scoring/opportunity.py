@@ -4,6 +4,8 @@ Opportunity scoring - calculates and ranks market opportunities.
 Uses weighted features to produce a 0-100 score per keyword.
 """
 
+import numpy as np
+
 WEIGHTS = {
     "trend_momentum": 0.3,
     "trend_acceleration": 0.2,
@@ -19,44 +21,38 @@ def normalize_features(features_dict):
     Input: {keyword: {trend_momentum: 0.05, competition_density: 0.01, ...}}
     Output: {keyword: {trend_momentum: 0.7, competition_density: 0.2, ...}}
 
-    All output values will be between 0 and 1.
+    All output values will be between 0 and 1. Internally the keywords are
+    stacked into an (n_keywords, n_features) matrix so the scaling is one
+    NumPy expression instead of nested per-keyword loops.
     """
-    all_values = {
-        "trend_momentum": [],
-        "competition_density": [],
-        "price_spread": [],
-        "trend_acceleration": [],
+    if not features_dict:
+        return {}
+
+    feature_names = list(WEIGHTS.keys())
+    matrix = np.array(
+        [
+            [
+                features["trend_momentum"],
+                1.0 if features["trend_acceleration"] else 0.0,
+                features["competition_density"],
+                features["price_stats"]["price_spread"],
+            ]
+            for features in features_dict.values()
+        ],
+        dtype=np.float64,
+    )
+
+    # Min-max scale each column; constant columns become 0.5
+    min_vals = matrix.min(axis=0)
+    max_vals = matrix.max(axis=0)
+    ranges = np.where(max_vals == min_vals, 1.0, max_vals - min_vals)
+    normalized = np.where(max_vals == min_vals, 0.5, (matrix - min_vals) / ranges)
+
+    return {
+        kw: dict(zip(feature_names, row.tolist()))
+        for kw, row in zip(features_dict.keys(), normalized)
     }
 
-    for kw, features in features_dict.items():
-        all_values["trend_momentum"].append(features["trend_momentum"])
-        all_values["competition_density"].append(features["competition_density"])
-        all_values["price_spread"].append(features["price_stats"]["price_spread"])
-        all_values["trend_acceleration"].append(
-            1.0 if features["trend_acceleration"] else 0.0
-        )
-
-    # Step 2: Calculate ranges
-    ranges = {}
-    for feature, values in all_values.items():
-        ranges[feature] = (min(values), max(values))
-
-    # Step 3: Normalize each keyword
-    normalized_map = {}
-    keywords = list(features_dict.keys())
-
-    for i, kw in enumerate(keywords):
-        normalized_map[kw] = {}
-        for feature in all_values.keys():
-            value = all_values[feature][i]
-            min_val, max_val = ranges[feature]
-            if max_val == min_val:
-                normalized_map[kw][feature] = 0.5
-            else:
-                normalized_map[kw][feature] = (value - min_val) / (max_val - min_val)
-
-    return normalized_map
-
 
 def calculate_scores(normalized_features, weights=WEIGHTS):
     """
@@ -64,17 +60,29 @@ def calculate_scores(normalized_features, weights=WEIGHTS):
 
     Returns: dict of {keyword: score} where score is 0-100
     """
+    if not normalized_features:
+        return {}
+
     min_possible = sum(w for w in weights.values() if w < 0)
     max_possible = sum(w for w in weights.values() if w > 0)
     score_range = max_possible - min_possible
 
-    scores = {}
-    for kw, features in normalized_features.items():
-        raw_score = sum(features[feature] * weights[feature] for feature in features)
-        scaled = (raw_score - min_possible) / score_range * 100
-        scores[kw] = round(scaled, 1)
-
-    return scores
+    # One matrix-vector product scores every keyword at once
+    feature_names = list(weights.keys())
+    weight_vec = np.array([weights[name] for name in feature_names])
+    matrix = np.array(
+        [
+            [features[name] for name in feature_names]
+            for features in normalized_features.values()
+        ],
+        dtype=np.float64,
+    )
+    scaled = (matrix @ weight_vec - min_possible) / score_range * 100
+
+    return {
+        kw: round(score, 1)
+        for kw, score in zip(normalized_features.keys(), scaled.tolist())
+    }
 
 
 def rank_opportunities(features_dict, weights=WEIGHTS):
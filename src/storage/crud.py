@@ -5,6 +5,9 @@ Handles create, read, update for categories, keywords, snapshots, and scores.
 """
 
 from datetime import datetime
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from storage.database import get_session
 from storage.models import Category, Keyword, DailySnapshot, OpportunityScore
 
@@ -102,15 +105,50 @@ def save_daily_snapshot(
     return snapshot.id
 
 
+def save_daily_snapshots(rows):
+    """
+    Save many daily snapshots in one batched INSERT.
+
+    `rows` is a list of dicts with the same keys as save_daily_snapshot's
+    arguments. Going through Core insert() skips the per-row ORM
+    unit-of-work overhead, which matters when the pipeline writes a
+    snapshot for every keyword of every category in one run.
+
+    Upserts on (keyword_id, snapshot_date), so re-running the daily job
+    refreshes that day's rows instead of failing or duplicating them.
+    """
+    if not rows:
+        return 0
+
+    session = get_session()
+    stmt = pg_insert(DailySnapshot).values(rows)
+    update_columns = {
+        column.name: stmt.excluded[column.name]
+        for column in DailySnapshot.__table__.columns
+        if column.name not in ("id", "keyword_id", "snapshot_date")
+    }
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["keyword_id", "snapshot_date"], set_=update_columns
+    )
+    session.execute(stmt)
+    session.commit()
+    return len(rows)
+
+
 def save_opportunity_score(keyword_id, score_date, score, weights):
     """
     Save an opportunity score to the database.
-    Returns the created score's id.
+    Upserts on (keyword_id, score_date) so same-day re-runs refresh the
+    score instead of violating the unique index.
     """
     session = get_session()
-    opp_score = OpportunityScore(
-        keyword_id=keyword_id, score_date=score_date, score=score, weights=weights
+    stmt = (
+        pg_insert(OpportunityScore)
+        .values(keyword_id=keyword_id, score_date=score_date, score=score, weights=weights)
+        .on_conflict_do_update(
+            index_elements=["keyword_id", "score_date"],
+            set_={"score": score, "weights": weights},
+        )
     )
-    session.add(opp_score)
+    session.execute(stmt)
     session.commit()
-    return opp_score.id
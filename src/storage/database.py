@@ -6,6 +6,7 @@ Uses SQLAlchemy with PostgreSQL.
 
 import os
 from dotenv import load_dotenv
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
@@ -13,7 +14,17 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
+
+def _json_dumps(obj):
+    """orjson serializer for JSON columns (the driver wants str, not bytes)."""
+    return orjson.dumps(obj).decode()
+
+
+engine = create_engine(
+    DATABASE_URL,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+)
 
 SessionLocal = sessionmaker(bind=engine)
 
@@ -1,22 +1,56 @@
 """
 Historical data storage for trend forecasting.
 
-Saves weekly snapshots of trends, scores, and product data to CSV files.
+Saves weekly snapshots of trends, scores, and product data as Parquet
+files laid out as table=<name>/date=<date>.parquet, so Arrow/DuckDB-style
+readers can prune by date without touching other files. Parquet is typed
+and compressed, so the files are several times smaller than the old CSVs
+and re-load without string parsing. (Pre-existing CSVs are still handled
+by scripts/backfill_from_csv.py.)
 """
 
+import functools
 import os
 from datetime import datetime
-import csv
+
+import numpy as np
+import pandas as pd
+
+from processing.features import price_stats_from_array
 
 # Base directory for historical data
 HISTORY_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data", "history")
 
 
-def get_date_str():
-    """Get current date as string for filenames."""
+@functools.lru_cache(maxsize=1)
+def _date_str_for(day_ordinal):
+    """Format the date string once per calendar day."""
     return datetime.now().strftime("%Y-%m-%d")
 
 
+def get_date_str():
+    """
+    Get current date as string for filenames.
+
+    Memoized per calendar day so repeated calls skip strftime.
+    """
+    return _date_str_for(datetime.now().toordinal())
+
+
+def _table_path(table, date_str):
+    """Build the partitioned path for one table's daily Parquet file."""
+    filepath = os.path.join(HISTORY_DIR, f"table={table}", f"date={date_str}.parquet")
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    return filepath
+
+
+def _write_parquet(df, filepath, float_columns=None):
+    """Write a daily partition, downcasting numeric columns to float32."""
+    if float_columns:
+        df = df.astype({col: "float32" for col in float_columns})
+    df.to_parquet(filepath, compression="zstd", index=False)
+
+
 def save_trends(opportunities, date_str=None):
     """
     Save trend data for all keywords.
@@ -26,24 +60,21 @@ def save_trends(opportunities, date_str=None):
     if date_str is None:
         date_str = get_date_str()
     
-    filepath = os.path.join(HISTORY_DIR, "trends", f"{date_str}.csv")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    
-    with open(filepath, "w", newline="") as f:
-        writer = csv.writer(f)
-        
-        # Header
-        header = ["date", "keyword"] + [f"week_{i+1}" for i in range(12)]
-        writer.writerow(header)
-        
-        # Data
-        for keyword, data in opportunities.items():
-            trends = data.get("trends", [])
-            # Pad to 12 weeks if shorter
-            trends = trends + [None] * (12 - len(trends))
-            row = [date_str, keyword] + trends[:12]
-            writer.writerow(row)
-    
+    filepath = _table_path("trends", date_str)
+
+    week_columns = [f"week_{i+1}" for i in range(12)]
+    header = ["date", "keyword"] + week_columns
+
+    rows = []
+    for keyword, data in opportunities.items():
+        trends = list(data.get("trends", []))
+        # Pad to 12 weeks if shorter
+        trends = trends + [None] * (12 - len(trends))
+        rows.append([date_str, keyword] + trends[:12])
+
+    df = pd.DataFrame.from_records(rows, columns=header)
+    _write_parquet(df, filepath, float_columns=week_columns)
+
     print(f"Saved trends to {filepath}")
     return filepath
 
@@ -58,34 +89,35 @@ def save_scores(features, scores, date_str=None):
     if date_str is None:
         date_str = get_date_str()
     
-    filepath = os.path.join(HISTORY_DIR, "scores", f"{date_str}.csv")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    
-    with open(filepath, "w", newline="") as f:
-        writer = csv.writer(f)
-        
-        # Header
-        header = [
-            "date", "keyword", "score", "trend_momentum", "trend_acceleration",
-            "competition_density", "price_spread", "avg_price"
+    filepath = _table_path("scores", date_str)
+
+    header = [
+        "date", "keyword", "score", "trend_momentum", "trend_acceleration",
+        "competition_density", "price_spread", "avg_price"
+    ]
+
+    rows = [
+        [
+            date_str,
+            keyword,
+            scores.get(keyword, 0),
+            feat.get("trend_momentum", 0),
+            feat.get("trend_acceleration", False),
+            feat.get("competition_density", 0),
+            feat.get("price_stats", {}).get("price_spread", 0),
+            feat.get("price_stats", {}).get("avg_price", 0),
         ]
-        writer.writerow(header)
-        
-        # Data
-        for keyword, feat in features.items():
-            score = scores.get(keyword, 0)
-            row = [
-                date_str,
-                keyword,
-                score,
-                feat.get("trend_momentum", 0),
-                feat.get("trend_acceleration", False),
-                feat.get("competition_density", 0),
-                feat.get("price_stats", {}).get("price_spread", 0),
-                feat.get("price_stats", {}).get("avg_price", 0),
-            ]
-            writer.writerow(row)
-    
+        for keyword, feat in features.items()
+    ]
+
+    df = pd.DataFrame.from_records(rows, columns=header)
+    _write_parquet(
+        df,
+        filepath,
+        float_columns=["score", "trend_momentum", "competition_density",
+                       "price_spread", "avg_price"],
+    )
+
     print(f"Saved scores to {filepath}")
     return filepath
 
@@ -99,35 +131,42 @@ def save_products(opportunities, date_str=None):
     if date_str is None:
         date_str = get_date_str()
     
-    filepath = os.path.join(HISTORY_DIR, "products", f"{date_str}.csv")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    
-    with open(filepath, "w", newline="") as f:
-        writer = csv.writer(f)
-        
-        # Header
-        header = ["date", "keyword", "listing_count", "unique_sellers", 
-                  "avg_price", "min_price", "max_price"]
-        writer.writerow(header)
-        
-        # Data
-        for keyword, data in opportunities.items():
-            products = data.get("products", [])
-            
-            prices = [float(p["price"]) for p in products if p.get("price")]
-            sellers = set(p["seller"] for p in products if p.get("seller"))
-            
-            row = [
-                date_str,
-                keyword,
-                len(products),
-                len(sellers),
-                round(sum(prices) / len(prices), 2) if prices else 0,
-                round(min(prices), 2) if prices else 0,
-                round(max(prices), 2) if prices else 0,
-            ]
-            writer.writerow(row)
-    
+    filepath = _table_path("products", date_str)
+
+    header = ["date", "keyword", "listing_count", "unique_sellers",
+              "avg_price", "min_price", "max_price"]
+
+    rows = []
+    for keyword, data in opportunities.items():
+        products = data.get("products", [])
+
+        # One pass over the products for both prices and sellers, instead
+        # of separate comprehensions re-reading each dict
+        prices = []
+        sellers = set()
+        for product in products:
+            price = product.get("price")
+            seller = product.get("seller")
+            if price:
+                prices.append(float(price))
+            if seller:
+                sellers.add(seller)
+
+        stats = price_stats_from_array(np.asarray(prices, dtype=np.float64))
+
+        rows.append([
+            date_str,
+            keyword,
+            len(products),
+            len(sellers),
+            stats["avg_price"],
+            stats["min_price"],
+            stats["max_price"],
+        ])
+
+    df = pd.DataFrame.from_records(rows, columns=header)
+    _write_parquet(df, filepath, float_columns=["avg_price", "min_price", "max_price"])
+
     print(f"Saved products to {filepath}")
     return filepath
 
@@ -14,7 +14,9 @@ from sqlalchemy import (
     ForeignKey,
     Date,
     Float,
+    Index,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.sql import func
 from storage.database import Base
 
@@ -44,10 +46,15 @@ class Keyword(Base):
 
 class DailySnapshot(Base):
     __tablename__ = "daily_snapshots"
+    # Every history read is keyed by (keyword, date); unique so the daily
+    # job can upsert instead of piling up duplicate rows
+    __table_args__ = (
+        Index("ix_daily_snap_kw_date", "keyword_id", "snapshot_date", unique=True),
+    )
 
     id = Column(Integer, primary_key=True)
     keyword_id = Column(Integer, ForeignKey("keywords.id"))
-    snapshot_date = Column(Date)
+    snapshot_date = Column(Date, server_default=func.current_date())
     trend_momentum = Column(Float)
     trend_acceleration = Column(Boolean)
     competition_density = Column(Float)
@@ -57,14 +64,19 @@ class DailySnapshot(Base):
     price_spread = Column(Float)
     listing_count = Column(Integer)
     unique_sellers = Column(Integer)
-    trend_values = Column(JSON)
+    # Native float array - smaller than JSON text, no parse on read, and
+    # aggregable in SQL; reads come back as a plain Python list of floats
+    trend_values = Column(ARRAY(Float))
 
 
 class OpportunityScore(Base):
     __tablename__ = "opportunity_scores"
+    __table_args__ = (
+        Index("ix_opp_score_kw_date", "keyword_id", "score_date", unique=True),
+    )
 
     id = Column(Integer, primary_key=True)
     keyword_id = Column(Integer, ForeignKey("keywords.id"))
-    score_date = Column(Date)
+    score_date = Column(Date, server_default=func.current_date())
     score = Column(Float)
     weights = Column(JSON)